@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+import os
 from base64 import b64decode
 from collections.abc import Mapping, Sequence
+from contextlib import contextmanager
 from dataclasses import InitVar, dataclass, field
 from datetime import datetime
-from json import JSONDecoder, JSONEncoder
-from typing import (Any, Callable, ClassVar, Iterator, MutableMapping,
-                    Optional, Type, TypeVar, cast)
+from hashlib import sha256
+from json import JSONDecoder, JSONEncoder, detect_encoding
+from mmap import ACCESS_READ, mmap
+from tempfile import TemporaryFile
+from typing import (Any, Callable, ClassVar, IO, Iterator, MutableMapping,
+                    Optional, Type, TypeVar, Union, cast)
 from urllib.parse import urlparse
 
 import dateutil.parser
 
-from requests import PreparedRequest, Session
+from requests import PreparedRequest, Response, Session
+from requests.adapters import BaseAdapter
 from requests.auth import AuthBase
 
 from yaml import safe_dump, safe_load
@@ -28,6 +34,57 @@ __all__ = [
     'SerializableSequence',
 ]
 
+Buffer = Union[bytes, bytearray, memoryview, mmap]
+"""A raw byte buffer"""
+
+canonical = JSONEncoder(sort_keys=True, separators=(',', ':'))
+"""Canonical JSON encoder"""
+
+
+def digest(data: Any) -> str:
+    """Calculate content digest of a data structure"""
+    return sha256(canonical.encode(data).encode()).hexdigest()
+
+
+def decode_buffer(buf: Buffer) -> str:
+    """Decode JSON text from a raw byte buffer"""
+    with memoryview(buf) as view:
+        encoding = detect_encoding(view[:4].tobytes())
+        return str(view, encoding, 'surrogatepass')
+
+
+@contextmanager
+def mapped(fh: IO[bytes]) -> Iterator[Buffer]:
+    """Map an open file into memory"""
+    if not os.fstat(fh.fileno()).st_size:
+        yield b''
+        return
+    with mmap(fh.fileno(), 0, access=ACCESS_READ) as buf:
+        yield buf
+
+
+@contextmanager
+def spooled(rsp: Response, max_size: int,
+            chunk_size: int) -> Iterator[Buffer]:
+    """Spool a streamed response body into memory or a mapped file"""
+    buf = bytearray()
+    chunks = rsp.iter_content(chunk_size=chunk_size)
+    for chunk in chunks:
+        buf += chunk
+        if len(buf) > max_size:
+            break
+    else:
+        yield buf
+        return
+    with TemporaryFile() as fh:
+        fh.write(buf)
+        del buf
+        for chunk in chunks:
+            fh.write(chunk)
+        fh.flush()
+        with mmap(fh.fileno(), 0, access=ACCESS_READ) as mbuf:
+            yield mbuf
+
 
 @dataclass
 class PerHostAuth(AuthBase):
@@ -59,14 +116,17 @@ class Serializable:
     data: Any = None
     """Data structure"""
 
-    json: InitVar[Optional[str]] = None
+    json: InitVar[Optional[Union[str, Buffer]]] = None
     yaml: InitVar[Optional[str]] = None
 
     _json_encoder: ClassVar[JSONEncoder] = JSONEncoder()
     _json_decoder: ClassVar[JSONDecoder] = JSONDecoder()
     _session: ClassVar[Session] = Session()
+    _spool_max_size: ClassVar[int] = 16 * 1024 * 1024
+    _spool_chunk_size: ClassVar[int] = 64 * 1024
 
-    def __post_init__(self, json: Optional[str], yaml: Optional[str]) -> None:
+    def __post_init__(self, json: Optional[Union[str, Buffer]],
+                      yaml: Optional[str]) -> None:
         json_default = type(self).json  # type: ignore[has-type]
         yaml_default = type(self).yaml  # type: ignore[has-type]
         if json is not None and json is not json_default:
@@ -77,23 +137,36 @@ class Serializable:
     def __str__(self) -> str:
         return self.yaml
 
+    @property
+    def digest(self) -> str:
+        """Content digest"""
+        return digest(self.data)
+
     @property  # type: ignore[no-redef]
     def json(self) -> str:  # pylint: disable=function-redefined
         """JSON serialization"""
         return self._json_encoder.encode(self.data)
 
     @json.setter
-    def json(self, value: str) -> None:
+    def json(self, value: Union[str, Buffer]) -> None:
+        if not isinstance(value, str):
+            value = decode_buffer(value)
         self.data = self._json_decoder.decode(value)
 
     @classmethod
     def fetch_json(cls: Type[Self], uri: str) -> Self:
         """Fetch JSON from URI"""
-        rsp = cls._session.get(uri)
-        rsp.raise_for_status()
-        if rsp.encoding is None:
-            rsp.encoding = 'utf-8'
-        return cls(json=rsp.text)
+        with cls._session.get(uri, stream=True) as rsp:
+            rsp.raise_for_status()
+            with spooled(rsp, cls._spool_max_size,
+                         cls._spool_chunk_size) as buf:
+                return cls(json=buf)
+
+    @classmethod
+    def load_json(cls: Type[Self], path: Union[str, os.PathLike]) -> Self:
+        """Load JSON from file"""
+        with open(path, 'rb') as fh, mapped(fh) as buf:
+            return cls(json=buf)
 
     @property  # type: ignore[no-redef]
     def yaml(self) -> str:  # pylint: disable=function-redefined
@@ -119,6 +192,11 @@ class Serializable:
         assert isinstance(cls._session.auth, PerHostAuth)
         cls._session.auth.register(host, auth)
 
+    @classmethod
+    def mount_adapter(cls, prefix: str, adapter: BaseAdapter) -> None:
+        """Register transport adapter for URIs starting with prefix"""
+        cls._session.mount(prefix, adapter)
+
 
 @dataclass
 class SerializableSequence(Serializable, Sequence):
@@ -0,0 +1,195 @@
+"""Indexed document collections
+
+A catalog holds loaded documents (such as NPM packages, PyPI packages
+or GitHub repositories) keyed by an arbitrary identifier, and maintains
+inverted indexes over chosen attribute paths such as ``license``,
+``maintainers.name`` or ``parent.full_name``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, MutableMapping
+from dataclasses import dataclass, field
+from typing import (Any, Callable, Dict, Hashable, Iterable, Iterator, List,
+                    Optional, Set, Union)
+
+from .base import (Serializable, SerializableMapping, SerializableSequence,
+                   digest)
+
+__all__ = [
+    'Catalog',
+    'Index',
+]
+
+
+def resolve(doc: Any, path: str) -> List[Any]:
+    """Resolve dotted attribute path to values
+
+    Serializable sequences and mappings encountered along the path are
+    expanded, so that (for example) ``maintainers.name`` yields the
+    name of each maintainer and ``dependencies`` yields each dependency
+    name.  Plain dictionaries are not expanded, but may be traversed by
+    key (e.g. ``license.type``).  Path components that are not
+    attributes of a data structure resolve to no values.
+    """
+    values = [doc]
+    for name in path.split('.'):
+        values = [item for value in values
+                  for item in expand(step(value, name))]
+    return values
+
+
+def step(value: Any, name: str) -> Any:
+    """Traverse one component of an attribute path"""
+    if isinstance(value, Serializable):
+        return getattr(value, name, None)
+    if isinstance(value, Mapping):
+        return value.get(name)
+    return None
+
+
+def expand(value: Any) -> Iterable[Any]:
+    """Expand serializable collections into their members"""
+    if value is None:
+        return ()
+    if isinstance(value, (SerializableSequence, SerializableMapping)):
+        return (item for item in value if item is not None)
+    return (value,)
+
+
+def hashable(value: Any) -> Hashable:
+    """Construct hashable index key for a value
+
+    Data structures, dictionaries, and lists are not hashable, and are
+    keyed by their content digest instead.
+    """
+    if isinstance(value, Serializable):
+        return value.digest
+    if isinstance(value, (dict, list)):
+        return digest(value)
+    return value
+
+
+Term = Union[Hashable, Callable[[Any], bool]]
+"""A query term: either a value or a predicate over values"""
+
+
+@dataclass
+class Index:
+    """An inverted index over a dotted attribute path"""
+
+    path: str
+    """Dotted attribute path"""
+
+    postings: Dict[Hashable, Set[Hashable]] = field(default_factory=dict)
+    """Document keys for each indexed value"""
+
+    values: Dict[Hashable, Any] = field(default_factory=dict)
+    """Indexed value for each index key"""
+
+    resolved: Dict[Hashable, Dict[Hashable, Any]] = field(
+        default_factory=dict
+    )
+    """Indexed values for each document key"""
+
+    def resolve(self, doc: Serializable) -> Dict[Hashable, Any]:
+        """Resolve document to indexed values"""
+        return {hashable(value): value for value in resolve(doc, self.path)}
+
+    def add(self, key: Hashable, values: Dict[Hashable, Any]) -> None:
+        """Add resolved document to index"""
+        self.resolved[key] = values
+        for ikey, value in values.items():
+            self.postings.setdefault(ikey, set()).add(key)
+            self.values.setdefault(ikey, value)
+
+    def remove(self, key: Hashable) -> None:
+        """Remove document from index"""
+        for ikey in self.resolved.pop(key, {}):
+            keys = self.postings.get(ikey)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.postings[ikey]
+                    del self.values[ikey]
+
+    def lookup(self, term: Term) -> Set[Hashable]:
+        """Look up document keys matching a value or predicate"""
+        if callable(term):
+            return set().union(*(keys for ikey, keys in self.postings.items()
+                                 if term(self.values[ikey])))
+        return self.postings.get(hashable(term), set())
+
+
+@dataclass
+class Catalog(MutableMapping):
+    """A collection of documents with inverted indexes"""
+
+    docs: Dict[Hashable, Serializable] = field(default_factory=dict)
+    """Documents"""
+
+    indexes: Dict[str, Index] = field(default_factory=dict)
+    """Indexes by attribute path"""
+
+    def __post_init__(self) -> None:
+        for index in self.indexes.values():
+            for key, doc in self.docs.items():
+                index.add(key, index.resolve(doc))
+
+    def __getitem__(self, key: Hashable) -> Serializable:
+        return self.docs[key]
+
+    def __setitem__(self, key: Hashable, doc: Serializable) -> None:
+        new = {path: index.resolve(doc)
+               for path, index in self.indexes.items()}
+        self.docs[key] = doc
+        for path, index in self.indexes.items():
+            index.remove(key)
+            index.add(key, new[path])
+
+    def __delitem__(self, key: Hashable) -> None:
+        del self.docs[key]
+        for index in self.indexes.values():
+            index.remove(key)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.docs)
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def index(self, *paths: str) -> None:
+        """Build indexes over dotted attribute paths"""
+        for path in paths:
+            if path not in self.indexes:
+                index = Index(path)
+                for key, doc in self.docs.items():
+                    index.add(key, index.resolve(doc))
+                self.indexes[path] = index
+
+    def find(self, terms: Optional[Mapping[str, Term]] = None,
+             **kwargs: Term) -> List[Serializable]:
+        """Find documents matching all terms
+
+        Each term maps a dotted attribute path to either a value or a
+        predicate over values.  Terms on indexed paths are answered by
+        intersecting index postings, smallest first.  Any remaining
+        terms are checked directly against the candidate documents.
+        Matching documents are returned in insertion order.
+        """
+        terms = {**(terms or {}), **kwargs}
+        indexed = sorted((self.indexes[path].lookup(term)
+                          for path, term in terms.items()
+                          if path in self.indexes), key=len)
+        keys = set.intersection(*indexed) if indexed else self.docs.keys()
+        return [doc for key, doc in self.docs.items() if key in keys and
+                all(self.matches(doc, path, term)
+                    for path, term in terms.items()
+                    if path not in self.indexes)]
+
+    @staticmethod
+    def matches(doc: Serializable, path: str, term: Term) -> bool:
+        """Check if document matches a term"""
+        if callable(term):
+            return any(term(value) for value in resolve(doc, path))
+        return any(value == term for value in resolve(doc, path))
@@ -6,11 +6,14 @@ https://github.com/npm/registry/blob/master/docs/responses/package-metadata.md
 
 from __future__ import annotations
 
+from collections import Counter
+from copy import deepcopy
 from dataclasses import dataclass
-from typing import Callable
+from typing import Any, Callable, ClassVar, Dict, List, Set, Tuple, Union
 
-from .base import (Attribute, DateTimeAttribute, DictAttribute, ListAttribute,
-                   Serializable, SerializableMapping, SerializableSequence)
+from .base import (Attribute, Buffer, DateTimeAttribute, DictAttribute,
+                   ListAttribute, Serializable, SerializableMapping,
+                   SerializableSequence, decode_buffer, digest)
 
 __all__ = [
     'NpmPackage',
@@ -124,3 +127,127 @@ class NpmPackage(NpmVersionHoisted):
     time = Attribute(type=NpmTime)
     users = DictAttribute()
     versions = DictAttribute(type=NpmVersions)
+
+    _hoisted: ClassVar[Tuple[str, ...]] = tuple(
+        attr.name for attr in vars(NpmVersionHoisted).values()
+        if isinstance(attr, Attribute)
+    )
+
+    def _objects(self) -> List[Dict[str, Any]]:
+        """Get package and version objects containing hoisted fields"""
+        if self.data is None:
+            return []
+        return [self.data, *self.data.get('versions', {}).values()]
+
+    def _digests(self) -> Dict[int, str]:
+        """Calculate digest of each distinct hoisted field value object"""
+        digests: Dict[int, str] = {}
+        for obj in self._objects():
+            for key in self._hoisted:
+                if key in obj and id(obj[key]) not in digests:
+                    digests[id(obj[key])] = digest(obj[key])
+        return digests
+
+    @property
+    def compact(self) -> Any:
+        """Compact representation
+
+        Hoisted fields (such as the readme or maintainers) that are
+        repeated across versions are stored once in a list of shared
+        values, and replaced in each object by a ``{"_blob": index}``
+        reference.
+
+        The compact representation is not itself a valid package, and
+        should be serialized via :attr:`compact_json`.  Assigning to
+        this property expands the references so that the package and
+        all of its versions share a single (deep copied) object for
+        each shared value.  An in-place modification of a shared value
+        will therefore affect every version using it, and will not be
+        reported by :meth:`changed`.
+        """
+        if self.data is None:
+            return None
+        digests = self._digests()
+        counts = Counter(digests[id(obj[key])] for obj in self._objects()
+                         for key in self._hoisted if key in obj)
+        blobs: List[Any] = []
+        index: Dict[str, int] = {}
+
+        def hoist(obj: Dict[str, Any]) -> Dict[str, Any]:
+            obj = dict(obj)
+            for key in self._hoisted:
+                if key in obj and counts[digests[id(obj[key])]] > 1:
+                    ref = digests[id(obj[key])]
+                    if ref not in index:
+                        index[ref] = len(blobs)
+                        blobs.append(obj[key])
+                    obj[key] = {'_blob': index[ref]}
+            return obj
+
+        data = hoist(self.data)
+        if 'versions' in data:
+            data['versions'] = {k: hoist(v)
+                                for k, v in data['versions'].items()}
+        data['_blobs'] = blobs
+        return data
+
+    @compact.setter
+    def compact(self, value: Any) -> None:
+        if value is None:
+            self.data = None
+            return
+        data = dict(value)
+        blobs = deepcopy(data.pop('_blobs', []))
+
+        def expand(obj: Dict[str, Any]) -> Dict[str, Any]:
+            return {k: (blobs[v['_blob']]
+                        if k in self._hoisted and isinstance(v, dict) and
+                        '_blob' in v else v)
+                    for k, v in obj.items()}
+
+        data = expand(data)
+        if 'versions' in data:
+            data['versions'] = {k: expand(v)
+                                for k, v in data['versions'].items()}
+        self.data = data
+
+    @property
+    def compact_json(self) -> str:
+        """Compact JSON serialization"""
+        return self._json_encoder.encode(self.compact)
+
+    @compact_json.setter
+    def compact_json(self, value: Union[str, Buffer]) -> None:
+        if not isinstance(value, str):
+            value = decode_buffer(value)
+        self.compact = self._json_decoder.decode(value)
+
+    def intern(self) -> None:
+        """Share identical hoisted field values between versions
+
+        This reduces memory usage, at the cost of aliasing: hoisted
+        field values must subsequently be treated as immutable, since
+        an in-place modification will affect every version sharing the
+        value.  Assign a new value instead.
+        """
+        self.compact = self.compact
+
+    @property
+    def digests(self) -> Dict[str, str]:
+        """Content digests of each version
+
+        Each hoisted field value is digested once per distinct object,
+        so this is cheapest after the package has been interned or
+        constructed from its compact representation.
+        """
+        digests = self._digests()
+        versions = {} if self.data is None else self.data.get('versions', {})
+        return {k: digest({f: (digests[id(x)] if f in self._hoisted else x)
+                           for f, x in v.items()})
+                for k, v in versions.items()}
+
+    def changed(self, other: NpmPackage) -> Set[str]:
+        """Identify versions added, removed, or modified since a snapshot"""
+        old = other.digests
+        new = self.digests
+        return {k for k in old.keys() | new.keys() if old.get(k) != new.get(k)}
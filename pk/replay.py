@@ -0,0 +1,227 @@
+"""Recorded HTTP transport
+
+HTTP responses may be recorded once into a compact archive, and later
+replayed without network access.  Replay can inject latency, limited
+bandwidth, and connection errors, in order to exercise fetch paths
+under repeatable network conditions.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from hashlib import sha256
+from io import BytesIO
+from json import JSONDecoder, JSONEncoder
+from random import Random
+from threading import Lock
+from time import sleep
+from typing import Any, Dict, List, Optional, Union
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from requests import ConnectionError as RequestsConnectionError
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+__all__ = [
+    'Archive',
+    'RecordingAdapter',
+    'ReplayAdapter',
+]
+
+
+@dataclass
+class Recording:
+    """A recorded HTTP response"""
+
+    status: int
+    """Status code"""
+
+    reason: Optional[str] = None
+    """Reason phrase"""
+
+    headers: Dict[str, str] = field(default_factory=dict)
+    """Response headers"""
+
+    body: bytes = b''
+    """Decoded response body"""
+
+
+@dataclass
+class Archive:
+    """An archive of recorded HTTP responses
+
+    The archive is stored as a ZIP file containing an ``index.json``
+    describing each response, with each distinct response body stored
+    once under its SHA-256 digest.
+    """
+
+    recordings: Dict[str, List[Recording]] = field(default_factory=dict)
+    """Recorded responses by request key"""
+
+    @staticmethod
+    def key(request: PreparedRequest) -> str:
+        """Construct request key"""
+        return '%s %s' % (request.method, request.url)
+
+    def record(self, request: PreparedRequest, rsp: Response) -> None:
+        """Record response"""
+        headers = {k: v for k, v in rsp.headers.items()
+                   if k.lower() not in ('content-encoding', 'content-length',
+                                        'transfer-encoding')}
+        recording = Recording(status=rsp.status_code, reason=rsp.reason,
+                              headers=headers, body=rsp.content or b'')
+        self.recordings.setdefault(self.key(request), []).append(recording)
+
+    def save(self, path: Union[str, os.PathLike]) -> None:
+        """Save archive to file"""
+        index: Dict[str, Any] = {}
+        with ZipFile(path, 'w', compression=ZIP_DEFLATED) as zf:
+            bodies = set()
+            for key, recordings in self.recordings.items():
+                index[key] = []
+                for recording in recordings:
+                    digest = sha256(recording.body).hexdigest()
+                    if digest not in bodies:
+                        zf.writestr('bodies/%s' % digest, recording.body)
+                        bodies.add(digest)
+                    index[key].append({
+                        'status': recording.status,
+                        'reason': recording.reason,
+                        'headers': recording.headers,
+                        'body': digest,
+                    })
+            zf.writestr('index.json', JSONEncoder().encode(index))
+
+    @classmethod
+    def load(cls, path: Union[str, os.PathLike]) -> Archive:
+        """Load archive from file"""
+        with ZipFile(path) as zf:
+            index = JSONDecoder().decode(zf.read('index.json').decode())
+            return cls({key: [Recording(
+                status=entry['status'],
+                reason=entry['reason'],
+                headers=entry['headers'],
+                body=zf.read('bodies/%s' % entry['body']),
+            ) for entry in entries] for key, entries in index.items()})
+
+
+@dataclass
+class RecordingAdapter(HTTPAdapter):
+    """HTTP transport adapter recording responses into an archive"""
+
+    archive: Archive = field(default_factory=Archive)
+    """Archive"""
+
+    lock: Lock = field(default_factory=Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        super().__init__()
+
+    def send(self, request: PreparedRequest,  # type: ignore[override]
+             *args: Any, **kwargs: Any) -> Response:
+        rsp = super().send(request, *args, **kwargs)
+        with self.lock:
+            self.archive.record(request, rsp)
+        return rsp
+
+
+@dataclass
+class ThrottledReader:
+    """A byte stream reader with limited bandwidth"""
+
+    raw: BytesIO
+    """Underlying byte stream"""
+
+    bandwidth: float
+    """Bandwidth (in bytes per second)"""
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """Read bytes"""
+        data = self.raw.read(size)
+        sleep(len(data) / self.bandwidth)
+        return data
+
+    def close(self) -> None:
+        """Close stream"""
+        self.raw.close()
+
+
+@dataclass
+class ReplayAdapter(BaseAdapter):
+    """HTTP transport adapter replaying responses from an archive
+
+    Repeated requests for the same method and URL replay the recorded
+    responses in order, repeating the last response once all have been
+    used.  Each response is delayed by ``latency`` seconds, and its
+    body is read at ``bandwidth`` bytes per second (if specified).  A
+    fraction ``errors`` of requests fail with a connection error,
+    without consuming a recorded response.  Random choices are drawn
+    from a generator seeded with ``seed``, so that a replay is
+    repeatable.
+    """
+
+    archive: Archive = field(default_factory=Archive)
+    """Archive"""
+
+    latency: float = 0
+    """Injected latency (in seconds)"""
+
+    bandwidth: Optional[float] = None
+    """Injected bandwidth limit (in bytes per second)"""
+
+    errors: float = 0
+    """Injected error rate"""
+
+    seed: Any = None
+    """Random number generator seed"""
+
+    random: Random = field(init=False, repr=False)
+    lock: Lock = field(default_factory=Lock, repr=False)
+    counts: Dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        super().__init__()
+        if self.latency < 0:
+            raise ValueError("Latency must be non-negative")
+        if self.bandwidth is not None and self.bandwidth <= 0:
+            raise ValueError("Bandwidth must be positive")
+        if not 0 <= self.errors <= 1:
+            raise ValueError("Error rate must be between 0 and 1")
+        self.random = Random(self.seed)
+
+    def send(self, request: PreparedRequest,  # type: ignore[override]
+             *_args: Any, **_kwargs: Any) -> Response:
+        key = Archive.key(request)
+        with self.lock:
+            recordings = self.archive.recordings.get(key)
+            if not recordings:
+                raise RequestsConnectionError("No recording for %s" % key,
+                                              request=request)
+            failed = self.random.random() < self.errors
+            count = self.counts.get(key, 0)
+            if not failed:
+                self.counts[key] = count + 1
+        sleep(self.latency)
+        if failed:
+            raise RequestsConnectionError("Injected error for %s" % key,
+                                          request=request)
+        recording = recordings[min(count, len(recordings) - 1)]
+        rsp = Response()
+        rsp.status_code = recording.status
+        rsp.reason = recording.reason  # type: ignore[assignment]
+        rsp.headers = CaseInsensitiveDict(recording.headers)
+        rsp.headers['Content-Length'] = str(len(recording.body))
+        rsp.encoding = get_encoding_from_headers(rsp.headers)
+        rsp.raw = BytesIO(recording.body)
+        if self.bandwidth is not None:
+            rsp.raw = ThrottledReader(rsp.raw, self.bandwidth)
+        rsp.url = request.url  # type: ignore[assignment]
+        rsp.request = request
+        rsp.connection = self  # type: ignore[assignment]
+        return rsp
+
+    def close(self) -> None:
+        pass
@@ -39,10 +39,14 @@ class GitHubRepoTest(unittest.TestCase):
     def test_token(self):
         """Test token authentication"""
         url = 'https://api.github.com/repos/mcb30/ipxe'
-        rsp = Response()
-        rsp.status_code = 200
-        rsp.raw = BytesIO(b'{}')
-        with patch.object(Session, 'send', return_value=rsp) as send:
+
+        def response(*_args, **_kwargs):
+            rsp = Response()
+            rsp.status_code = 200
+            rsp.raw = BytesIO(b'{}')
+            return rsp
+
+        with patch.object(Session, 'send', side_effect=response) as send:
             with patch.dict(os.environ, {'GITHUB_TOKEN': 'secret'}):
                 GitHubRepo.fetch_json(url)
                 send.assert_called_once()
@@ -53,3 +57,17 @@ class GitHubRepoTest(unittest.TestCase):
                 GitHubRepo.fetch_json(url)
                 send.assert_called_once()
                 self.assertNotIn('Authorization', send.call_args[0][0].headers)
+
+    def test_fetch(self):
+        """Test fetching JSON via memory and via spooled file"""
+        url = 'https://api.github.com/repos/mcb30/ipxe'
+        raw = (self.files / 'ipxe.json').read_bytes()
+        for max_size in (len(raw), 1024):
+            rsp = Response()
+            rsp.status_code = 200
+            rsp.raw = BytesIO(raw)
+            with patch.object(Session, 'send', return_value=rsp), \
+                    patch.object(GitHubRepo, '_spool_max_size', max_size):
+                gh = GitHubRepo.fetch_json(url)
+            self.assertEqual(gh.owner.login, 'mcb30')
+            self.assertEqual(gh.source.full_name, 'ipxe/ipxe')
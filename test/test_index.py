@@ -0,0 +1,160 @@
+"""Index tests"""
+
+import sys
+import unittest
+from pathlib import Path
+
+from pk.github import GitHubRepo
+from pk.index import Catalog
+from pk.npm import NpmPackage
+from pk.pypi import PyPiPackage
+
+
+class CatalogTest(unittest.TestCase):
+    """Catalog tests"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.files = Path(sys.modules[cls.__module__].__file__).parent / 'files'
+        cls.npm = NpmPackage.load_json(cls.files / 'leftpad.json')
+        cls.pypi = PyPiPackage.load_json(cls.files / 'idiosync.json')
+        cls.gh = GitHubRepo.load_json(cls.files / 'ipxe.json')
+
+    def test_npm(self):
+        """Test NPM package queries"""
+        catalog = Catalog()
+        catalog.index('maintainers.name', 'keywords', 'license')
+        catalog['leftpad'] = self.npm
+        self.assertEqual(catalog.find({'maintainers.name': 'tmcw'}),
+                         [self.npm])
+        self.assertEqual(catalog.find({'maintainers.name': 'tmcw',
+                                       'license': 'BSD-3-Clause'}),
+                         [self.npm])
+        self.assertEqual(catalog.find({'maintainers.name': 'tmcw',
+                                       'license': 'MIT'}), [])
+        self.assertEqual(catalog.find(keywords='formatting'), [self.npm])
+        self.assertEqual(catalog.find(name='leftpad'), [self.npm])
+
+    def test_pypi(self):
+        """Test PyPI package queries"""
+        catalog = Catalog({'idiosync': self.pypi})
+        catalog.index('info.classifiers')
+        self.assertEqual(catalog.find({
+            'info.classifiers': lambda x: x.startswith('Topic ::'),
+            'info.license': 'GPLv2+',
+        }), [self.pypi])
+        self.assertEqual(catalog.find({
+            'info.classifiers': 'Environment :: Console',
+            'info.license': lambda x: x.startswith('MIT'),
+        }), [])
+
+    def test_github(self):
+        """Test GitHub repository queries"""
+        catalog = Catalog(indexes={})
+        catalog.index('owner.login', 'parent.full_name')
+        catalog['mcb30/ipxe'] = self.gh
+        catalog['ipxe/ipxe'] = self.gh.parent
+        self.assertEqual(catalog.find({'parent.full_name': 'ipxe/ipxe'}),
+                         [self.gh])
+        self.assertEqual(len(catalog.find({'owner.login': 'mcb30'})), 1)
+        self.assertEqual(len(catalog.find()), 2)
+
+    def test_update(self):
+        """Test incremental index updates"""
+        catalog = Catalog()
+        catalog.index('owner.login')
+        catalog['repo'] = self.gh
+        self.assertEqual(catalog.find({'owner.login': 'mcb30'}), [self.gh])
+        catalog['repo'] = self.gh.parent
+        self.assertEqual(catalog.find({'owner.login': 'mcb30'}), [])
+        self.assertEqual(catalog.find({'owner.login': 'ipxe'}),
+                         [self.gh.parent])
+        del catalog['repo']
+        self.assertFalse(catalog)
+        self.assertFalse(catalog.indexes['owner.login'].postings)
+
+    def test_mixed(self):
+        """Test queries over mixed document types"""
+        catalog = Catalog()
+        catalog.index('maintainers.name', 'owner.login', 'classifiers',
+                      'license.spdx_id')
+        catalog['npm'] = self.npm
+        catalog['pypi'] = self.pypi.info
+        catalog['gh'] = self.gh
+        self.assertEqual(catalog.find({'maintainers.name': 'tmcw'}),
+                         [self.npm])
+        self.assertEqual(catalog.find({'owner.login': 'mcb30'}), [self.gh])
+        self.assertEqual(catalog.find(classifiers='Topic :: Security'),
+                         [self.pypi.info])
+        self.assertEqual(catalog.find({'license.spdx_id': 'NOASSERTION'}),
+                         [self.gh])
+        self.assertEqual(catalog.find({'author.name': 'Tom MacWright'}),
+                         [self.npm])
+        self.assertEqual(catalog.find(author='Michael Brown'),
+                         [self.pypi.info])
+        self.assertEqual(catalog.find({'name.length': 7}), [])
+
+    def test_structure(self):
+        """Test indexing data structure values"""
+        catalog = Catalog({'leftpad': self.npm})
+        catalog.index('repository')
+        self.assertEqual(catalog.find(repository=self.npm.repository),
+                         [self.npm])
+        self.assertEqual(catalog.find(repository=lambda x: x.type == 'git'),
+                         [self.npm])
+
+    def test_order(self):
+        """Test result ordering"""
+        catalog = Catalog()
+        catalog.index('owner.login')
+        keys = ['repo%d' % i for i in range(20)]
+        for key in keys:
+            catalog[key] = GitHubRepo(self.gh.data)
+        found = catalog.find({'owner.login': 'mcb30'})
+        self.assertEqual([id(x) for x in found],
+                         [id(catalog[key]) for key in keys])
+
+    def test_atomic(self):
+        """Test failed updates leave the catalog unchanged"""
+        catalog = Catalog()
+        catalog.index('owner.login', 'pushed_at')
+        catalog['repo'] = self.gh
+        with self.assertRaises(ValueError):
+            catalog['repo'] = GitHubRepo({'owner': {'login': 'ipxe'},
+                                          'pushed_at': 'never'})
+        with self.assertRaises(ValueError):
+            catalog['other'] = GitHubRepo({'pushed_at': 'never'})
+        self.assertEqual(list(catalog), ['repo'])
+        self.assertEqual(catalog.find({'owner.login': 'mcb30'}), [self.gh])
+        self.assertEqual(catalog.find({'owner.login': 'ipxe'}), [])
+
+    def test_mutate(self):
+        """Test replacing and deleting mutated documents"""
+        gh = GitHubRepo.load_json(self.files / 'ipxe.json')
+        catalog = Catalog()
+        catalog.index('owner.login', 'pushed_at')
+        catalog['repo'] = gh
+        gh.data['owner'] = {'login': 'someone'}
+        catalog['repo'] = gh
+        self.assertEqual(catalog.find({'owner.login': 'mcb30'}), [])
+        self.assertEqual(catalog.find({'owner.login': 'someone'}), [gh])
+        gh.data['owner'] = {'login': 'nobody'}
+        gh.data['pushed_at'] = 'never'
+        del catalog['repo']
+        self.assertFalse(catalog.indexes['owner.login'].postings)
+        self.assertFalse(catalog.indexes['pushed_at'].postings)
+
+    def test_plain(self):
+        """Test indexing plain dictionary and list values"""
+        lic = {'type': 'MIT', 'url': 'https://opensource.org/licenses/MIT'}
+        npm = NpmPackage({'license': lic})
+        info = PyPiPackage({'info': {'platform': ['linux', 'win32']}}).info
+        catalog = Catalog({'npm': npm, 'pypi': info})
+        catalog.index('license', 'license.type', 'platform')
+        self.assertEqual(list(catalog.indexes['license'].values.values()),
+                         [lic])
+        self.assertEqual(catalog.find({'license.type': 'MIT'}), [npm])
+        self.assertEqual(catalog.find(license=dict(lic)), [npm])
+        self.assertEqual(catalog.find(license='type'), [])
+        self.assertEqual(catalog.find(platform=['linux', 'win32']), [info])
+        self.assertEqual(catalog.find(platform=['linux']), [])
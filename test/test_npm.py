@@ -33,3 +33,54 @@ class NpmPackageTest(unittest.TestCase):
                          '^0.8.2')
         self.assertEqual(npm.versions['0.0.1'].dist.shasum,
                          '86b1a4de4face180ac545a83f1503523d8fed115')
+
+    def test_load(self):
+        """Test JSON loading from file"""
+        npm = NpmPackage.load_json(self.files / 'leftpad.json')
+        self.assertEqual(npm.author.name, "Tom MacWright")
+        self.assertEqual(npm.versions['0.0.1'].maintainers[0].name, 'tmcw')
+
+    def test_bytes(self):
+        """Test JSON parsing from bytes"""
+        raw = (self.files / 'leftpad.json').read_bytes()
+        npm = NpmPackage(json=raw)
+        self.assertEqual(npm.dist_tags.latest, '0.0.1')
+        npm = NpmPackage(json=raw.decode().encode('utf-16'))
+        self.assertEqual(npm.dist_tags.latest, '0.0.1')
+
+    def test_compact(self):
+        """Test compact representation"""
+        npm = NpmPackage.load_json(self.files / 'leftpad.json')
+        compact = npm.compact
+        ref = compact['versions']['0.0.1']['maintainers']['_blob']
+        self.assertEqual(compact['_blobs'][ref][0]['name'], 'tmcw')
+        self.assertEqual(compact['maintainers'], {'_blob': ref})
+        self.assertEqual(compact['versions']['0.0.0']['license'],
+                         npm.versions['0.0.0'].license)
+        self.assertLess(len(npm.compact_json), len(npm.json))
+        copy = NpmPackage()
+        copy.compact_json = npm.compact_json
+        self.assertEqual(copy.data, npm.data)
+        self.assertEqual(copy.maintainers[0].name, 'tmcw')
+        copy.compact_json = npm.compact_json.encode()
+        self.assertEqual(copy.data, npm.data)
+        copy.compact = compact
+        self.assertIsNot(copy.data['maintainers'], compact['_blobs'][ref])
+        self.assertIs(copy.versions['0.0.0'].data['maintainers'],
+                      copy.versions['0.0.1'].data['maintainers'])
+        npm.intern()
+        self.assertIs(npm.data['maintainers'],
+                      npm.versions['0.0.1'].data['maintainers'])
+
+    def test_changed(self):
+        """Test changed version detection"""
+        old = NpmPackage.load_json(self.files / 'leftpad.json')
+        new = NpmPackage.load_json(self.files / 'leftpad.json')
+        self.assertEqual(new.digests, old.digests)
+        self.assertFalse(new.changed(old))
+        new.intern()
+        self.assertFalse(new.changed(old))
+        new.data['versions']['0.0.1']['description'] = 'Left pad'
+        self.assertEqual(new.changed(old), {'0.0.1'})
+        del new.data['versions']['0.0.0']
+        self.assertEqual(new.changed(old), {'0.0.0', '0.0.1'})
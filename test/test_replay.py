@@ -0,0 +1,128 @@
+"""Replay tests"""
+
+import sys
+import unittest
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from requests import ConnectionError as RequestsConnectionError
+from requests import HTTPError, Response
+from requests.adapters import HTTPAdapter
+
+from pk.github import GitHubRepo
+from pk.replay import Archive, Recording, RecordingAdapter, ReplayAdapter
+
+
+class ReplayTest(unittest.TestCase):
+    """Record and replay tests"""
+
+    url = 'https://api.github.com/repos/mcb30/ipxe'
+
+    @classmethod
+    def setUpClass(cls):
+        cls.files = Path(sys.modules[cls.__module__].__file__).parent / 'files'
+
+    def tearDown(self):
+        GitHubRepo.mount_adapter('https://', HTTPAdapter())
+
+    def response(self, *_args, **_kwargs):
+        """Construct live response"""
+        rsp = Response()
+        rsp.status_code = 200
+        rsp.headers['Content-Type'] = 'application/json'
+        rsp.raw = BytesIO((self.files / 'ipxe.json').read_bytes())
+        return rsp
+
+    def record(self):
+        """Record archive"""
+        archive = Archive()
+        GitHubRepo.mount_adapter('https://', RecordingAdapter(archive))
+        with patch.object(HTTPAdapter, 'send', side_effect=self.response):
+            gh = GitHubRepo.fetch_json(self.url)
+            GitHubRepo.fetch_json(self.url)
+        self.assertEqual(gh.owner.login, 'mcb30')
+        return archive
+
+    def test_record(self):
+        """Test recording and archive storage"""
+        archive = self.record()
+        recordings = archive.recordings['GET %s' % self.url]
+        self.assertEqual(len(recordings), 2)
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / 'archive.zip'
+            archive.save(path)
+            self.assertLess(path.stat().st_size, len(recordings[0].body))
+            self.assertEqual(Archive.load(path), archive)
+
+    def test_replay(self):
+        """Test replay"""
+        archive = self.record()
+        GitHubRepo.mount_adapter('https://', ReplayAdapter(archive))
+        gh = GitHubRepo.fetch_json(self.url)
+        self.assertEqual(gh.source.full_name, 'ipxe/ipxe')
+        with self.assertRaises(RequestsConnectionError):
+            GitHubRepo.fetch_json('https://api.github.com/repos/ipxe/ipxe')
+
+    def test_network(self):
+        """Test injected network conditions"""
+        archive = self.record()
+        size = len(archive.recordings['GET %s' % self.url][0].body)
+        adapter = ReplayAdapter(archive, latency=0.5, bandwidth=size / 2)
+        GitHubRepo.mount_adapter('https://', adapter)
+        with patch('pk.replay.sleep') as sleep:
+            GitHubRepo.fetch_json(self.url)
+        delays = [call[0][0] for call in sleep.call_args_list]
+        self.assertEqual(delays[0], 0.5)
+        self.assertAlmostEqual(sum(delays[1:]), 2)
+
+    def test_errors(self):
+        """Test injected errors"""
+        archive = self.record()
+        results = []
+        for _ in range(2):
+            adapter = ReplayAdapter(archive, errors=0.5, seed=42)
+            GitHubRepo.mount_adapter('https://', adapter)
+            result = []
+            for _ in range(20):
+                try:
+                    GitHubRepo.fetch_json(self.url)
+                    result.append(True)
+                except RequestsConnectionError:
+                    result.append(False)
+            results.append(result)
+        self.assertIn(True, results[0])
+        self.assertIn(False, results[0])
+        self.assertEqual(results[0], results[1])
+
+    def test_sequence(self):
+        """Test replay order with injected errors"""
+        url = 'https://api.github.com/user'
+        archive = Archive({'GET %s' % url: [
+            Recording(status=401, body=b'{}'),
+            Recording(status=200, body=b'{}'),
+        ]})
+        adapter = ReplayAdapter(archive, errors=0.5, seed=1)
+        GitHubRepo.mount_adapter('https://', adapter)
+        results = []
+        for _ in range(10):
+            try:
+                GitHubRepo.fetch_json(url)
+                results.append(200)
+            except HTTPError as exc:
+                results.append(exc.response.status_code)
+            except RequestsConnectionError:
+                results.append(None)
+        self.assertIn(None, results)
+        self.assertEqual([x for x in results if x is not None][:3],
+                         [401, 200, 200])
+
+    def test_invalid(self):
+        """Test invalid network conditions"""
+        with self.assertRaises(ValueError):
+            ReplayAdapter(latency=-1)
+        with self.assertRaises(ValueError):
+            ReplayAdapter(bandwidth=0)
+        with self.assertRaises(ValueError):
+            ReplayAdapter(errors=1.5)